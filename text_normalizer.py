@@ -4,53 +4,65 @@ Text Normalizer for Spec Matcher
 Cleans and organizes automotive specification text for better GPT processing
 """
 
+import functools
+import hashlib
 import re
 import string
 from openai import OpenAI
 
+# Precompiled patterns for basic_text_cleanup (avoids re-parsing on every call)
+_RE_DISALLOWED = re.compile(r'[^\w\s\-\(\)\[\].,;:!?\'"°%/&+]')
+_RE_WHITESPACE = re.compile(r'\s+')
+_RE_SPACE_BEFORE_PUNCT = re.compile(r'\s+([,.;:!?])')
+_RE_MISSING_SPACE_AFTER_PUNCT = re.compile(r'([,.;:!?])([A-Za-z])')
+_RE_CAMEL_CASE = re.compile(r'([a-z])([A-Z])')
+_RE_PAREN_OPEN = re.compile(r'\s*\(\s*')
+_RE_PAREN_CLOSE = re.compile(r'\s*\)\s*')
+_RE_BRACKET_OPEN = re.compile(r'\s*\[\s*')
+_RE_BRACKET_CLOSE = re.compile(r'\s*\]\s*')
+_RE_NUMBER_UNIT = re.compile(r'(\d)\s*([A-Za-z]{1,3})\b')
+_RE_NUMBER_SYMBOL = re.compile(r'(\d)\s*([°%])')
+_RE_MULTI_SPACE = re.compile(r'[ ]{2,}')
+
+# Exact-match cache of normalize_spec_text results, keyed by input hash + options
+_NORMALIZE_CACHE = {}
+_NORMALIZE_CACHE_MAX_ENTRIES = 128
+
 def basic_text_cleanup(text):
     """First pass: Basic cleanup of spacing, symbols, and formatting"""
     
     # Remove or replace problematic characters
-    text = text.replace('\r\n', '\n').replace('\r', '\n')  # Normalize line endings
-    text = text.replace('\t', ' ')  # Replace tabs with spaces
-    text = re.sub(r'[^\w\s\-\(\)\[\].,;:!?\'"°%/&+]', ' ', text)  # Keep only readable chars
+    text = _RE_DISALLOWED.sub(' ', text)  # Keep only readable chars
     
-    # Fix spacing issues
-    text = re.sub(r'\s+', ' ', text)  # Multiple spaces to single space
-    text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)  # Multiple newlines to double newline
-    text = re.sub(r'\n ', '\n', text)  # Remove space after newline
-    text = re.sub(r' \n', '\n', text)  # Remove space before newline
+    # Fix spacing issues in a single pass: every run of whitespace (spaces,
+    # tabs, CR/LF line endings, blank lines) collapses to one space
+    text = _RE_WHITESPACE.sub(' ', text)
     
     # Fix punctuation spacing
-    text = re.sub(r'\s+([,.;:!?])', r'\1', text)  # Remove space before punctuation
-    text = re.sub(r'([,.;:!?])([A-Za-z])', r'\1 \2', text)  # Add space after punctuation
-    text = re.sub(r'([a-z])([A-Z])', r'\1 \2', text)  # Add space between lowercase-uppercase
+    text = _RE_SPACE_BEFORE_PUNCT.sub(r'\1', text)  # Remove space before punctuation
+    text = _RE_MISSING_SPACE_AFTER_PUNCT.sub(r'\1 \2', text)  # Add space after punctuation
+    text = _RE_CAMEL_CASE.sub(r'\1 \2', text)  # Add space between lowercase-uppercase
     
     # Fix parentheses and brackets
-    text = re.sub(r'\s*\(\s*', ' (', text)
-    text = re.sub(r'\s*\)\s*', ') ', text)
-    text = re.sub(r'\s*\[\s*', ' [', text)
-    text = re.sub(r'\s*\]\s*', '] ', text)
+    text = _RE_PAREN_OPEN.sub(' (', text)
+    text = _RE_PAREN_CLOSE.sub(') ', text)
+    text = _RE_BRACKET_OPEN.sub(' [', text)
+    text = _RE_BRACKET_CLOSE.sub('] ', text)
     
     # Clean up measurements and technical terms
-    text = re.sub(r'(\d)\s*([A-Za-z]{1,3})\b', r'\1\2', text)  # "17 inch" -> "17inch"
-    text = re.sub(r'(\d)\s*([°%])', r'\1\2', text)  # "90 %" -> "90%"
+    text = _RE_NUMBER_UNIT.sub(r'\1\2', text)  # "17 inch" -> "17inch"
+    text = _RE_NUMBER_SYMBOL.sub(r'\1\2', text)  # "90 %" -> "90%"
     
     # Remove excessive whitespace
-    text = re.sub(r'[ ]{2,}', ' ', text)
+    text = _RE_MULTI_SPACE.sub(' ', text)
     text = text.strip()
     
     return text
 
-def intelligent_text_organization(text, llm_model="gpt-4o"):
-    """Second pass: Use GPT to ONLY organize existing text without adding content"""
-    
-    # Don't process if text is already very clean and short
-    if len(text) < 200 and text.count('\n') < 5:
-        return text
-    
-    prompt = """You are a text organization expert for automotive specifications.
+# Static instructions for intelligent_text_organization. Kept in the system message,
+# separate from the spec text, so the identical prefix can be served from the
+# OpenAI prompt cache on repeat calls.
+ORGANIZATION_SYSTEM_PROMPT = """You are a text organization expert for automotive specifications.
 
 CRITICAL RULES:
 1. NEVER add new words, information, or content that isn't in the original
@@ -60,19 +72,31 @@ CRITICAL RULES:
 5. ONLY fix obvious spacing and line break issues
 6. If unsure, leave text unchanged
 
-TASK: Reorganize this automotive text for better readability WITHOUT adding any new content.
-
-INPUT TEXT:
-{text}
+TASK: Reorganize the automotive text in the user message for better readability WITHOUT adding any new content.
 
 OUTPUT: Same content, just better organized with proper spacing and paragraph breaks. NO NEW WORDS."""
 
+@functools.lru_cache(maxsize=1)
+def _get_openai_client():
+    """Shared OpenAI client so repeated normalizations reuse its connection pool"""
+    return OpenAI()
+
+def intelligent_text_organization(text, llm_model="gpt-4o"):
+    """Second pass: Use GPT to ONLY organize existing text without adding content"""
+    
+    # Don't process if text is already very clean and short
+    if len(text) < 200 and text.count('\n') < 5:
+        return text
+    
     try:
-        client = OpenAI()
+        client = _get_openai_client()
         response = client.chat.completions.create(
             model=llm_model,
             temperature=0.1,  # Very low temperature for conservative changes
-            messages=[{"role": "user", "content": prompt.format(text=text)}],
+            messages=[
+                {"role": "system", "content": ORGANIZATION_SYSTEM_PROMPT},
+                {"role": "user", "content": f"INPUT TEXT:\n{text}"},
+            ],
             stream=False
         )
         
@@ -84,14 +108,18 @@ OUTPUT: Same content, just better organized with proper spacing and paragraph br
             return text
         
         # Strict validation - content should not grow significantly
-        original_words = set(text.lower().split())
-        organized_words = set(organized_text.lower().split()) if organized_text else set()
+        original_words = frozenset(text.lower().split())
+        max_new_words = len(original_words) * 0.1  # More than 10% new words = suspicious
         
-        # Check if too many new words were added
-        new_words = organized_words - original_words
-        if len(new_words) > len(original_words) * 0.1:  # More than 10% new words = suspicious
-            print(f"⚠️ GPT organization added too many new words: {new_words}")
-            return text
+        # Check if too many new words were added, stopping as soon as the limit is crossed
+        new_words = set()
+        for word in (organized_text or '').split():
+            word = word.lower()
+            if word not in original_words:
+                new_words.add(word)
+                if len(new_words) > max_new_words:
+                    print(f"⚠️ GPT organization added too many new words: {new_words}")
+                    return text
         
         # Check length growth
         if organized_text and len(organized_text) > len(text) * 1.2:  # More than 20% growth = suspicious
@@ -120,6 +148,16 @@ def normalize_spec_text(text, use_gpt_organization=True, llm_model="gpt-4o"):
     if not text or not text.strip():
         return text
     
+    cache_key = (
+        hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest(),
+        bool(use_gpt_organization),
+        llm_model,
+    )
+    cached_text = _NORMALIZE_CACHE.get(cache_key)
+    if cached_text is not None:
+        print(f"♻️ Using cached normalization: {len(text)} → {len(cached_text)} chars")
+        return cached_text
+    
     print("🧹 Normalizing input text...")
     
     # Step 1: Basic cleanup
@@ -135,11 +173,21 @@ def normalize_spec_text(text, use_gpt_organization=True, llm_model="gpt-4o"):
         final_text = basic_text_cleanup(organized_text)
         
         print(f"  ✅ Normalized: {len(text)} → {len(final_text)} chars")
+        # Don't cache a GPT fallback (text returned unchanged) so it is retried next time
+        if organized_text != cleaned_text:
+            _store_normalized(cache_key, final_text)
         return final_text
     else:
         print(f"  ✅ Basic cleanup: {len(text)} → {len(cleaned_text)} chars")
+        _store_normalized(cache_key, cleaned_text)
         return cleaned_text
 
+def _store_normalized(cache_key, normalized_text):
+    """Remember a normalization result, evicting the oldest entry when full"""
+    if len(_NORMALIZE_CACHE) >= _NORMALIZE_CACHE_MAX_ENTRIES:
+        _NORMALIZE_CACHE.pop(next(iter(_NORMALIZE_CACHE)))
+    _NORMALIZE_CACHE[cache_key] = normalized_text
+
 def demo_normalizer():
     """Demo the text normalizer with sample automotive text"""
     